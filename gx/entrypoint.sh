@@ -18,6 +18,7 @@ echo "Available commands:"
 echo "  python /app/scripts/init_gx.py      - Initialize GX context and datasource"
 echo "  python /app/scripts/profile_data.py - Profile tables and create baseline expectations"
 echo "  python /app/scripts/run_validation.py - Run validations"
+echo "  python /app/scripts/pipeline.py       - Init, profile and validate in one run"
 echo "  jupyter notebook --ip=0.0.0.0 --port=8888 --allow-root --no-browser"
 echo ""
 
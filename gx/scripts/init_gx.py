@@ -14,13 +14,17 @@ def get_connection_string():
 
     return f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{database}"
 
-def init_context():
-    """Initialize GX context with PostgreSQL datasource."""
+def init_context(context=None):
+    """Initialize GX context with PostgreSQL datasource.
+
+    An already-built context can be passed in to avoid loading it again.
+    """
     print("Initializing Great Expectations context...")
     print(f"GX Version: {gx.__version__}")
 
     # Get existing context
-    context = gx.get_context(project_root_dir="/app")
+    if context is None:
+        context = gx.get_context(project_root_dir="/app")
 
     # Add PostgreSQL datasource
     connection_string = get_connection_string()
@@ -28,16 +32,27 @@ def init_context():
 
     # Check if datasource already exists using new API
     datasource_name = "tpcc_postgres"
-    existing_datasources = [ds.name for ds in context.data_sources.all()]
+    existing_datasources = {ds.name: ds for ds in context.data_sources.all()}
 
     if datasource_name in existing_datasources:
         print(f"Datasource '{datasource_name}' already exists")
-        datasource = context.data_sources.get(datasource_name)
+        datasource = existing_datasources[datasource_name]
     else:
         # Create new datasource using factory method
+        # Extra create_engine() arguments for GX's own engine: room for the
+        # concurrent validations, and the psycopg2 fast execution helpers
+        # for executemany() writes
         datasource = context.data_sources.add_postgres(
             name=datasource_name,
-            connection_string=connection_string
+            connection_string=connection_string,
+            kwargs={
+                "pool_size": 8,
+                "max_overflow": 16,
+                "pool_pre_ping": True,
+                "executemany_mode": "values_plus_batch",
+                "insertmanyvalues_page_size": 1000,
+                "executemany_batch_page_size": 500,
+            }
         )
         print(f"Created datasource: {datasource_name}")
 
@@ -55,8 +70,12 @@ def init_context():
     ]
 
     # Add table assets
+    existing_assets = {asset.name for asset in datasource.assets}
     for table_name in tpcc_tables:
         asset_name = f"{table_name}_asset"
+        if asset_name in existing_assets:
+            print(f"  Table asset already exists: {asset_name}")
+            continue
         try:
             asset = datasource.add_table_asset(
                 name=asset_name,
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Run the full init -> profile -> validate sequence in a single process.
+
+Equivalent to running init_gx.py, profile_data.py and run_validation.py
+one after another, but the GX context and the pooled SQLAlchemy engine
+are built once and shared by all three steps.
+"""
+
+import great_expectations as gx
+
+from init_gx import init_context
+from profile_data import auto_profile, get_engine
+from run_validation import run_validations
+
+
+def run_pipeline():
+    """Initialize GX, auto-profile the tables and validate them."""
+    context = gx.get_context(project_root_dir="/app")
+    engine = get_engine()
+
+    init_context(context)
+    auto_profile(context, engine)
+    return run_validations(context)
+
+
+def main():
+    results = run_pipeline()
+
+    # Exit with error code if any failures
+    if any(success is False for _, _, success in results):
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,16 @@ a custom profiler that:
 3. Automatically generates appropriate GX expectations
 """
 
+import glob
+import hashlib
+import json
+import math
 import os
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import great_expectations as gx
 from sqlalchemy import create_engine, text
 
@@ -24,92 +33,428 @@ def get_connection_string():
     return f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{database}"
 
 
-def get_column_stats(engine, table_name):
-    """Query PostgreSQL for column statistics."""
+_engine = None
+
+# The GX context is not thread-safe for writes; guards suite mutations
+# (and keeps each table's report together on stdout)
+_context_lock = threading.Lock()
+
+
+def get_engine():
+    """Return the shared, pooled SQLAlchemy engine (created on first use)."""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(
+            get_connection_string(),
+            pool_size=8,
+            max_overflow=16,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            # No WAL flush waits on commit
+            connect_args={"options": "-c synchronous_commit=off"},
+            # psycopg2 fast execution helpers for any executemany() writes
+            executemany_mode="values_plus_batch",
+            insertmanyvalues_page_size=1000,
+            executemany_batch_page_size=500
+        )
+    return _engine
+
+
+def get_sample_pct():
+    """Read the TABLESAMPLE percentage used for profiling (100 = full scan)."""
+    return float(os.environ.get('GX_PROFILE_SAMPLE_PCT', '5.0'))
+
+
+STATS_CACHE_DIR = "/app/gx/.cache"
+# Bump whenever the shape of the stats dicts changes, to invalidate old entries
+STATS_CACHE_VERSION = 3
+
+NUMERIC_TYPES = ('integer', 'smallint', 'bigint', 'numeric', 'real', 'double precision')
+STRING_TYPES = ('character varying', 'text', 'character', 'varchar')
+
+# Per-column SELECT fragments of the stats query, by shape; {c} is the
+# quoted column name
+STAT_FRAGMENTS = {
+    "numeric": ('MIN({c})', 'MAX({c})', 'AVG({c})::numeric(20,4)'),
+    "string": ('MIN(LENGTH({c}))', 'MAX(LENGTH({c}))', 'AVG(LENGTH({c}))::numeric(10,2)'),
+    "nulls": ('SUM(CASE WHEN {c} IS NULL THEN 1 ELSE 0 END)',),
+}
+
+# Aggregate SELECT list specialized per (table, column set), see
+# get_stat_select_list
+_STAT_SQL = {}
+
+# Fixed-shape statements, built once and reused for every table
+COLUMN_QUERY = text("""
+    SELECT
+        ordinal_position,
+        column_name,
+        data_type,
+        is_nullable
+    FROM information_schema.columns
+    WHERE table_name = :table_name
+    AND table_schema = 'public'
+""")
+
+# Columns that are by themselves a PRIMARY KEY or UNIQUE constraint. The
+# constraint guarantees uniqueness on the full table, so no COUNT(DISTINCT)
+# is needed; members of compound keys are not unique on their own and are
+# never returned
+KEY_COLUMN_QUERY = text("""
+    SELECT MIN(kcu.column_name)
+    FROM information_schema.table_constraints tc
+    JOIN information_schema.key_column_usage kcu
+        ON tc.constraint_name = kcu.constraint_name
+        AND tc.table_schema = kcu.table_schema
+        AND tc.table_name = kcu.table_name
+    WHERE tc.table_name = :table_name
+    AND tc.table_schema = 'public'
+    AND tc.constraint_type IN ('PRIMARY KEY', 'UNIQUE')
+    GROUP BY tc.constraint_name
+    HAVING COUNT(*) = 1
+""")
+
+RELTUPLES_QUERY = text("""
+    SELECT reltuples::bigint
+    FROM pg_class
+    WHERE relname = :table_name
+    AND relnamespace = 'public'::regnamespace
+""")
+
+RELATION_QUERY = text("""
+    SELECT
+        c.reltuples::bigint,
+        pg_relation_size(c.oid),
+        c.xmin::text,
+        s.n_tup_ins,
+        s.n_tup_upd,
+        s.n_tup_del
+    FROM pg_class c
+    LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+    WHERE c.relname = :table_name
+    AND c.relnamespace = 'public'::regnamespace
+""")
+
+DDL_HASH_QUERY = text("""
+    SELECT md5(string_agg(column_name || ':' || data_type, ',' ORDER BY ordinal_position))
+    FROM information_schema.columns
+    WHERE table_name = :table_name
+    AND table_schema = 'public'
+""")
+
+SYSTEM_ROWS_QUERY = text("SELECT 1 FROM pg_extension WHERE extname = 'tsm_system_rows'")
+
+
+def get_approx_row_count(conn, table_name):
+    """Return the planner's row estimate (pg_class.reltuples) for a table.
+
+    Kept current by ANALYZE/autovacuum, so no COUNT(*) scan is needed.
+    Returns None if the table has never been analyzed (reltuples = -1).
+    """
+    reltuples = conn.execute(RELTUPLES_QUERY, {"table_name": table_name}).scalar()
+    return reltuples if reltuples is not None and reltuples >= 0 else None
+
+
+def sampled_from(conn, table_name, n):
+    """Return a FROM-clause snippet yielding roughly ``n`` random rows of a table.
+
+    Row-level statistics (quantiles, medians, top-K, ...) must read their
+    rows through this helper. Never sample with ``ORDER BY random() LIMIT n``:
+    Postgres has to read and sort the whole table before applying the LIMIT.
+
+    Uses ``TABLESAMPLE SYSTEM_ROWS(n)`` when the tsm_system_rows extension is
+    installed, otherwise a ``random() < p`` prefilter with ``p`` derived
+    from pg_class.reltuples (still one sequential scan, but no sort).
+    """
+    table = conn.dialect.identifier_preparer.quote(table_name)
+    has_system_rows = conn.execute(SYSTEM_ROWS_QUERY).scalar() is not None
+    if has_system_rows:
+        return f"{table} TABLESAMPLE SYSTEM_ROWS({int(n)})"
+
+    approx_total = get_approx_row_count(conn, table_name)
+    p = min(1.0, n / approx_total) if approx_total else 1.0
+    return f"(SELECT * FROM {table} WHERE random() < {p}) s"
+
+
+def stream_rows(conn, sql, params=None, batch_size=10000):
+    """Yield the rows of a row-returning query through a server-side cursor.
+
+    Keeps memory bounded by ``batch_size`` instead of materializing the
+    whole result with ``fetchall()``; use it for value distributions
+    (top-K, histograms) rather than single aggregate rows. The options are
+    passed per statement so ``conn`` itself is left unchanged. psycopg2
+    named cursors need a transaction, so ``conn`` must not be in AUTOCOMMIT.
+    """
+    result = conn.execute(
+        text(sql), params or {},
+        execution_options={"stream_results": True, "max_row_buffer": batch_size},
+    )
+    for row in result.yield_per(batch_size):
+        yield row
+
+
+def copy_query_to(conn, sql, fileobj):
+    """Write the result of ``sql`` to ``fileobj`` as CSV (with header) via COPY.
+
+    COPY ... TO STDOUT skips the per-row DBAPI protocol and is the fastest
+    way to bulk-read a wide result set. NULLs are written as ``\\N`` so they
+    stay distinct from empty strings.
+    """
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY ({sql}) TO STDOUT WITH (FORMAT csv, HEADER, NULL '\\N')", fileobj
+        )
+    finally:
+        cursor.close()
+
+
+def get_stat_select_list(conn, table_name, columns):
+    """Return the aggregate SELECT list for a table, generated once per schema.
+
+    The list is specialized to the table's exact column set and cached in
+    ``_STAT_SQL``; a changed schema produces a new cache key.
+    """
+    cache_key = (table_name, tuple(columns))
+    if cache_key not in _STAT_SQL:
+        # Identifiers cannot be bound, so they are quoted and spliced in
+        quote = conn.dialect.identifier_preparer.quote
+        fragments = ["COUNT(*)"]
+        for col_name, data_type, _ in columns:
+            shapes = []
+            if data_type in NUMERIC_TYPES:
+                shapes.append("numeric")
+            elif data_type in STRING_TYPES:
+                shapes.append("string")
+            shapes.append("nulls")
+            for shape in shapes:
+                fragments.extend(t.format(c=quote(col_name)) for t in STAT_FRAGMENTS[shape])
+        _STAT_SQL[cache_key] = ', '.join(fragments)
+    return _STAT_SQL[cache_key]
+
+
+def execute_stat_query(conn, table_name, select_list, sample_pct=None):
+    """Run the aggregate stats query as a server-side prepared statement.
+
+    The statement is PREPAREd once per pooled connection (tracked in the
+    connection's ``info`` dict, which lives as long as the DBAPI connection)
+    and then only EXECUTEd, so Postgres skips parsing and planning on reuse.
+    ``sample_pct=None`` scans the whole table.
+    """
+    quote = conn.dialect.identifier_preparer.quote
+    sampled = sample_pct is not None
+    digest = hashlib.md5(select_list.encode()).hexdigest()[:8]
+    name = quote(f"stat_{table_name}_{'sampled' if sampled else 'full'}_{digest}")
+
+    prepared = conn.connection.info.setdefault("prepared_stat_queries", set())
+    if name not in prepared:
+        if sampled:
+            conn.exec_driver_sql(
+                f"PREPARE {name} (real) AS SELECT {select_list} "
+                f"FROM {quote(table_name)} TABLESAMPLE SYSTEM ($1)"
+            )
+        else:
+            conn.exec_driver_sql(
+                f"PREPARE {name} AS SELECT {select_list} FROM {quote(table_name)}"
+            )
+        prepared.add(name)
+
+    if sampled:
+        return conn.execute(
+            text(f"EXECUTE {name} (:sample_pct)"), {"sample_pct": sample_pct}
+        ).fetchone()
+    return conn.execute(text(f"EXECUTE {name}")).fetchone()
+
+
+def get_column_stats(conn, table_name, sample_pct=None):
+    """Query PostgreSQL for column statistics.
+
+    All per-column aggregates are computed by a single SELECT over a
+    block-level TABLESAMPLE of the table. The table row count
+    (``approx_total``) is taken from pg_class.reltuples rather than a
+    COUNT(*) of the table, unless the table has never been analyzed; null
+    counts refer to the sampled rows (``sample_count``). ``is_unique`` comes from single-column PRIMARY KEY /
+    UNIQUE constraints, never from the sample.
+    """
+    if sample_pct is None:
+        sample_pct = get_sample_pct()
     stats = []
 
-    # Get column info
-    column_query = text("""
-        SELECT
-            column_name,
-            data_type,
-            is_nullable
-        FROM information_schema.columns
-        WHERE table_name = :table_name
-        AND table_schema = 'public'
-        ORDER BY ordinal_position
-    """)
+    # Columns keyed by ordinal position; the server returns them unsorted and
+    # both the SELECT list and the stats list follow this explicit order
+    col_by_pos = {
+        row.ordinal_position: row
+        for row in conn.execute(COLUMN_QUERY, {"table_name": table_name})
+    }
+    columns = [col_by_pos[pos][1:] for pos in sorted(col_by_pos)]
+    unique_columns = {
+        row[0] for row in conn.execute(KEY_COLUMN_QUERY, {"table_name": table_name})
+    }
+
+    select_list = get_stat_select_list(conn, table_name, columns)
+
+    def run_stats_query(sampled):
+        return execute_stat_query(
+            conn, table_name, select_list, sample_pct if sampled else None
+        )
+
+    result = None
+    if sample_pct < 100:
+        result = run_stats_query(sampled=True)
+
+    if result is not None and result[0] > 0:
+        sample_count = result[0]
+        scale = 100 / sample_pct
+    else:
+        # Sampling disabled, or the table is too small for any block to
+        # be picked: fall back to a full scan
+        result = run_stats_query(sampled=False)
+        sample_count = result[0]
+        scale = 1
+
+    # COUNT(*) above only sizes the sample (it rides along in the same scan);
+    # the table row count comes from the catalog. A never-analyzed table is
+    # counted exactly: a block sample of a small table picks all or nothing
+    # of a page, so scaling it up can be off by the full 100 / sample_pct
+    approx_total = get_approx_row_count(conn, table_name)
+    if approx_total is None:
+        if scale == 1:
+            approx_total = sample_count
+        else:
+            quote = conn.dialect.identifier_preparer.quote
+            approx_total = conn.execute(
+                text(f"SELECT COUNT(*) FROM {quote(table_name)}")
+            ).scalar()
+
+    # Walk the result row in the same order the fragments were built
+    i = 1
+    for col_name, data_type, is_nullable in columns:
+        stat = {
+            "column": col_name,
+            "data_type": data_type,
+            "is_nullable": is_nullable == "YES",
+            "approx_total": approx_total,
+            "sample_count": sample_count,
+        }
+
+        if data_type in NUMERIC_TYPES:
+            min_val, max_val, avg_val = result[i:i + 3]
+            i += 3
+            stat.update({
+                "min": float(min_val) if min_val is not None else None,
+                "max": float(max_val) if max_val is not None else None,
+                "avg": float(avg_val) if avg_val is not None else None,
+                "is_numeric": True
+            })
+        else:
+            stat["is_numeric"] = False
+
+        if data_type in STRING_TYPES:
+            min_len, max_len, avg_len = result[i:i + 3]
+            i += 3
+            stat.update({
+                "min_len": min_len,
+                "max_len": max_len,
+                "avg_len": float(avg_len) if avg_len is not None else None
+            })
+
+        stat["null_count"] = result[i]
+        i += 1
+
+        stat["is_unique"] = col_name in unique_columns
+
+        stats.append(stat)
+
+    return stats
+
+
+def get_table_fingerprint(conn, table_name, sample_pct):
+    """Hash the table's DDL, keys, size and modification counters into a cache key.
+
+    Any DML bumps the pg_stat_user_tables counters, and ANALYZE/VACUUM
+    refresh reltuples and the relation size, so a changed table gets a new
+    key (they update the pg_class row in place, so xmin only moves on DDL).
+    Key constraints feed ``is_unique`` but do not touch the column DDL, so
+    they are hashed in as well.
+    """
+    relation = conn.execute(RELATION_QUERY, {"table_name": table_name}).fetchone()
+    ddl_hash = conn.execute(DDL_HASH_QUERY, {"table_name": table_name}).scalar()
+    key_columns = tuple(sorted(
+        row[0] for row in conn.execute(KEY_COLUMN_QUERY, {"table_name": table_name})
+    ))
+    key = repr((STATS_CACHE_VERSION, table_name, tuple(relation or ()), ddl_hash,
+                key_columns, sample_pct))
+    return hashlib.sha1(key.encode()).hexdigest()[:16]
 
-    with engine.connect() as conn:
-        columns = conn.execute(column_query, {"table_name": table_name}).fetchall()
-
-        for col_name, data_type, is_nullable in columns:
-            stat = {
-                "column": col_name,
-                "data_type": data_type,
-                "is_nullable": is_nullable == "YES"
-            }
-
-            # Get statistics for numeric columns
-            if data_type in ('integer', 'smallint', 'bigint', 'numeric', 'real', 'double precision'):
-                numeric_query = text(f"""
-                    SELECT
-                        MIN("{col_name}") as min_val,
-                        MAX("{col_name}") as max_val,
-                        AVG("{col_name}")::numeric(20,4) as avg_val,
-                        COUNT(*) as total_count,
-                        SUM(CASE WHEN "{col_name}" IS NULL THEN 1 ELSE 0 END) as null_count,
-                        COUNT(DISTINCT "{col_name}") as distinct_count
-                    FROM {table_name}
-                """)
-                result = conn.execute(numeric_query).fetchone()
-                stat.update({
-                    "min": float(result[0]) if result[0] is not None else None,
-                    "max": float(result[1]) if result[1] is not None else None,
-                    "avg": float(result[2]) if result[2] is not None else None,
-                    "total_count": result[3],
-                    "null_count": result[4],
-                    "distinct_count": result[5],
-                    "is_numeric": True
-                })
-            else:
-                # Get basic stats for non-numeric columns
-                basic_query = text(f"""
-                    SELECT
-                        COUNT(*) as total_count,
-                        SUM(CASE WHEN "{col_name}" IS NULL THEN 1 ELSE 0 END) as null_count,
-                        COUNT(DISTINCT "{col_name}") as distinct_count
-                    FROM {table_name}
-                """)
-                result = conn.execute(basic_query).fetchone()
-                stat.update({
-                    "total_count": result[0],
-                    "null_count": result[1],
-                    "distinct_count": result[2],
-                    "is_numeric": False
-                })
-
-            stats.append(stat)
+
+def get_cached_column_stats(conn, table_name, sample_pct=None):
+    """Return column statistics, reusing a cached copy if the table is unchanged."""
+    if sample_pct is None:
+        sample_pct = get_sample_pct()
+
+    fingerprint = get_table_fingerprint(conn, table_name, sample_pct)
+    cache_path = os.path.join(STATS_CACHE_DIR, f"stats_{table_name}_{fingerprint}.json")
+
+    # A missing, truncated or otherwise unreadable entry is just a miss
+    try:
+        with open(cache_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    stats = get_column_stats(conn, table_name, sample_pct)
+
+    # Drop stale entries for this table before writing the new one. Match the
+    # fingerprint exactly so "order" does not sweep up "order_line" entries.
+    os.makedirs(STATS_CACHE_DIR, exist_ok=True)
+    stale_pattern = f"stats_{glob.escape(table_name)}_" + "[0-9a-f]" * 16 + ".json"
+    for stale_path in glob.glob(os.path.join(STATS_CACHE_DIR, stale_pattern)):
+        try:
+            os.remove(stale_path)
+        except FileNotFoundError:
+            pass  # removed by a concurrent run
+
+    # Write to a temp file and rename it into place, so a crash or a
+    # concurrent run never leaves a partial entry behind
+    fd, tmp_path = tempfile.mkstemp(dir=STATS_CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(stats, f)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
 
     return stats
 
 
 def generate_expectations_from_stats(suite, stats, table_name):
-    """Generate GX expectations based on column statistics."""
-    expectations_added = 0
+    """Generate GX expectations based on column statistics.
+
+    Expectations are collected locally and attached to the suite in a
+    single mutation, so the suite is persisted once rather than per
+    expectation.
+    """
+    new_exps = []
+
+    # (expectation type, column) pairs already in the suite, so duplicates
+    # are skipped up front instead of relying on GX to reject them
+    existing_keys = {
+        (e.expectation_type, getattr(e, "column", None)) for e in suite.expectations
+    }
+
+    def add(expectation):
+        key = (expectation.expectation_type, getattr(expectation, "column", None))
+        if key not in existing_keys:
+            existing_keys.add(key)
+            new_exps.append(expectation)
 
     for stat in stats:
         col = stat["column"]
 
         # 1. NOT NULL expectation if column has no nulls and is defined as NOT NULL
         if stat["null_count"] == 0:
-            try:
-                suite.add_expectation(
-                    gx.expectations.ExpectColumnValuesToNotBeNull(column=col)
-                )
-                expectations_added += 1
-            except Exception:
-                pass
+            add(gx.expectations.ExpectColumnValuesToNotBeNull(column=col))
 
         # 2. Numeric range expectations with margin
         if stat.get("is_numeric") and stat.get("min") is not None:
@@ -123,111 +468,125 @@ def generate_expectations_from_stats(suite, stats, table_name):
             expected_min = min_val - margin
             expected_max = max_val + margin
 
-            try:
-                suite.add_expectation(
-                    gx.expectations.ExpectColumnValuesToBeBetween(
-                        column=col,
-                        min_value=round(expected_min, 4),
-                        max_value=round(expected_max, 4)
-                    )
+            add(
+                gx.expectations.ExpectColumnValuesToBeBetween(
+                    column=col,
+                    min_value=round(expected_min, 4),
+                    max_value=round(expected_max, 4)
                 )
-                expectations_added += 1
-            except Exception:
-                pass
-
-        # 3. Uniqueness expectation if column appears to be a key
-        if stat["distinct_count"] == stat["total_count"] and stat["total_count"] > 0:
-            # Skip if it's a compound key situation (check column name patterns)
-            if "_id" in col.lower() or col.lower().endswith("id"):
-                try:
-                    suite.add_expectation(
-                        gx.expectations.ExpectColumnValuesToBeUnique(column=col)
-                    )
-                    expectations_added += 1
-                except Exception:
-                    pass
-
-    # 4. Table row count expectation
-    if stats and stats[0].get("total_count"):
-        row_count = stats[0]["total_count"]
+            )
+
+        # 3. String length expectations from the precomputed length aggregates,
+        # with the same 10% margin (the extremes come from a sample)
+        if stat.get("min_len") is not None:
+            min_len = stat["min_len"]
+            max_len = stat["max_len"]
+
+            range_size = max_len - min_len if max_len != min_len else max_len * 0.1
+            margin = range_size * 0.1
+
+            add(
+                gx.expectations.ExpectColumnValueLengthsToBeBetween(
+                    column=col,
+                    min_value=max(0, math.floor(min_len - margin)),
+                    max_value=math.ceil(max_len + margin)
+                )
+            )
+
+        # 4. Uniqueness expectation if the column is a single-column key
+        # (compound key members are not flagged, see KEY_COLUMN_QUERY)
+        if stat.get("is_unique"):
+            add(gx.expectations.ExpectColumnValuesToBeUnique(column=col))
+
+    # 5. Table row count expectation
+    if stats and stats[0].get("approx_total"):
+        row_count = stats[0]["approx_total"]
         # Allow 20% variation in row count
         min_rows = int(row_count * 0.8)
         max_rows = int(row_count * 1.2)
-        try:
-            suite.add_expectation(
-                gx.expectations.ExpectTableRowCountToBeBetween(
-                    min_value=min_rows,
-                    max_value=max_rows
-                )
+        add(
+            gx.expectations.ExpectTableRowCountToBeBetween(
+                min_value=min_rows,
+                max_value=max_rows
             )
-            expectations_added += 1
-        except Exception:
-            pass
+        )
 
-    return expectations_added
+    # Attach the whole batch and persist the suite once
+    suite.expectations = list(suite.expectations) + new_exps
+    suite.save()
+
+    return len(new_exps)
 
 
 def auto_profile_table(context, engine, datasource_name, table_name, asset_name, suite_name):
-    """Automatically profile a table and generate expectations."""
-    print(f"\n{'='*50}")
-    print(f"Auto-profiling: {table_name}")
-    print(f"{'='*50}")
+    """Automatically profile a table and generate expectations.
 
+    Safe to call from several threads at once: the SQL runs on a pooled
+    connection of its own, while suite writes and output are serialized
+    through ``_context_lock``.
+    """
     # Get column statistics from database
-    print("  Querying column statistics...")
-    stats = get_column_stats(engine, table_name)
-    print(f"  Found {len(stats)} columns")
-
-    # Show discovered statistics
-    for stat in stats:
-        col = stat["column"]
-        if stat.get("is_numeric"):
-            print(f"    {col}: {stat['data_type']} "
-                  f"[{stat['min']:.2f} - {stat['max']:.2f}] "
-                  f"nulls={stat['null_count']}")
-        else:
-            print(f"    {col}: {stat['data_type']} "
-                  f"distinct={stat['distinct_count']} "
-                  f"nulls={stat['null_count']}")
-
-    # Create expectation suite
-    print(f"\n  Generating expectations...")
-    try:
-        suite = context.suites.add(gx.ExpectationSuite(name=suite_name))
-    except Exception as e:
-        if "already exists" in str(e).lower():
-            print(f"  Suite {suite_name} already exists, deleting and recreating...")
-            context.suites.delete(suite_name)
+    with engine.connect() as conn:
+        # Profiling is read-only: no transaction bookkeeping, snapshots
+        # released after each statement. Set per connection so the engine
+        # default stays transactional for stream_rows' named cursors.
+        conn.execution_options(isolation_level="AUTOCOMMIT", postgresql_readonly=True)
+        stats = get_cached_column_stats(conn, table_name)
+
+    with _context_lock:
+        print(f"\n{'='*50}")
+        print(f"Auto-profiling: {table_name}")
+        print(f"{'='*50}")
+        print(f"  Found {len(stats)} columns")
+
+        # Show discovered statistics (written in one go)
+        lines = []
+        for stat in stats:
+            col = stat["column"]
+            if stat.get("is_numeric"):
+                lines.append(f"    {col}: {stat['data_type']} "
+                             f"[{stat['min']:.2f} - {stat['max']:.2f}] "
+                             f"nulls={stat['null_count']}")
+            else:
+                lines.append(f"    {col}: {stat['data_type']} "
+                             f"unique={stat['is_unique']} "
+                             f"nulls={stat['null_count']}")
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+
+        # Create expectation suite
+        print(f"\n  Generating expectations...")
+        try:
             suite = context.suites.add(gx.ExpectationSuite(name=suite_name))
-        else:
-            raise e
+        except Exception as e:
+            if "already exists" in str(e).lower():
+                print(f"  Suite {suite_name} already exists, deleting and recreating...")
+                context.suites.delete(suite_name)
+                suite = context.suites.add(gx.ExpectationSuite(name=suite_name))
+            else:
+                raise e
 
-    # Generate expectations from statistics
-    count = generate_expectations_from_stats(suite, stats, table_name)
-    print(f"  Created {count} expectations automatically")
+        # Generate expectations from statistics
+        count = generate_expectations_from_stats(suite, stats, table_name)
+        print(f"  Created {count} expectations automatically")
 
-    # Show generated expectations
-    print(f"  Expectations:")
-    for exp in suite.expectations:
-        print(f"    - {exp.expectation_type}")
+        # Show generated expectations
+        print(f"  Expectations:")
+        if suite.expectations:
+            sys.stdout.write(
+                "\n".join(f"    - {exp.expectation_type}" for exp in suite.expectations) + "\n"
+            )
 
     return suite
 
 
-def main():
+def auto_profile(context, engine):
+    """Profile every TPC-C table using an existing GX context and engine."""
     print("=" * 60)
     print("Great Expectations Custom Auto-Profiler")
     print("Learning rules from actual data statistics")
     print("=" * 60)
 
-    # Connect to database
-    connection_string = get_connection_string()
-    engine = create_engine(connection_string)
-    print(f"\nConnected to PostgreSQL")
-
-    # Get GX context
-    context = gx.get_context(project_root_dir="/app")
-
     # Tables to auto-profile
     tables = [
         ("warehouse", "warehouse_asset", "warehouse_auto"),
@@ -237,14 +596,22 @@ def main():
         ("item", "item_asset", "item_auto"),
     ]
 
-    for table_name, asset_name, suite_name in tables:
-        try:
-            auto_profile_table(
-                context, engine, "tpcc_postgres",
+    # Profile all tables concurrently; each worker borrows a pooled connection
+    print(f"\nProfiling {len(tables)} tables in parallel...")
+    with ThreadPoolExecutor(max_workers=len(tables)) as executor:
+        futures = {
+            executor.submit(
+                auto_profile_table, context, engine, "tpcc_postgres",
                 table_name, asset_name, suite_name
-            )
-        except Exception as e:
-            print(f"  Error profiling {table_name}: {e}")
+            ): table_name
+            for table_name, asset_name, suite_name in tables
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                with _context_lock:
+                    print(f"  Error profiling {futures[future]}: {e}")
 
     print("\n" + "=" * 60)
     print("AUTO-PROFILING COMPLETE")
@@ -252,6 +619,17 @@ def main():
     print("\nGenerated expectation suites:")
     for suite in context.suites.all():
         print(f"  - {suite.name}: {len(suite.expectations)} expectations")
+
+
+def main():
+    # Connect to database
+    engine = get_engine()
+
+    # Get GX context
+    context = gx.get_context(project_root_dir="/app")
+
+    auto_profile(context, engine)
+
     print("\nRun validation with:")
     print("  python /app/scripts/run_validation.py")
 
@@ -1,44 +1,138 @@
 #!/usr/bin/env python3
 """Run validations against expectation suites."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import great_expectations as gx
-from datetime import datetime
+from datetime import datetime, timezone
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
 
+from sql_validator import validate_suite_in_sql
 
-def run_validation(context, datasource_name, asset_name, suite_name):
-    """Run a single validation and return results."""
-    print(f"\nValidating {asset_name} against {suite_name}...")
 
-    try:
-        # Get datasource and asset
+# The GX context is not thread-safe for writes; guards batch/validation
+# definition creation (and keeps each validation's report together on stdout)
+_context_lock = threading.Lock()
+
+
+def build_lookup_caches(context):
+    """Load datasources, suites and validation definitions once, keyed by name.
+
+    Each ``context.<store>.get()`` call re-reads the store in GX 1.x, so the
+    validation loop looks objects up in these dicts instead.
+    """
+    return {
+        "data_sources": {ds.name: ds for ds in context.data_sources.all()},
+        "suites": {s.name: s for s in context.suites.all()},
+        "validation_definitions": {
+            vd.name: vd for vd in context.validation_definitions.all()
+        },
+    }
+
+
+def get_validation_definition(context, datasource_name, asset_name, suite_name, caches):
+    """Look up the validation definition for an asset/suite pair, creating it if needed."""
+    # Get datasource and asset
+    datasource = caches["data_sources"].get(datasource_name)
+    if datasource is None:
         datasource = context.data_sources.get(datasource_name)
-        asset = datasource.get_asset(asset_name)
+    asset = datasource.get_asset(asset_name)
 
-        # Get or create batch definition
-        batch_def_name = f"{asset_name}_batch"
-        try:
-            batch_definition = asset.get_batch_definition(batch_def_name)
-        except Exception:
-            batch_definition = asset.add_batch_definition_whole_table(name=batch_def_name)
+    # Get or create batch definition
+    batch_def_name = f"{asset_name}_batch"
+    try:
+        batch_definition = asset.get_batch_definition(batch_def_name)
+    except Exception:
+        batch_definition = asset.add_batch_definition_whole_table(name=batch_def_name)
 
-        # Get expectation suite
+    # Get expectation suite
+    suite = caches["suites"].get(suite_name)
+    if suite is None:
         suite = context.suites.get(suite_name)
 
-        # Create validation definition
-        validation_name = f"{asset_name}_{suite_name}_validation"
-        try:
-            validation_definition = context.validation_definitions.get(validation_name)
-        except Exception:
-            validation_definition = context.validation_definitions.add(
-                gx.ValidationDefinition(
-                    name=validation_name,
-                    data=batch_definition,
-                    suite=suite
-                )
+    # Create validation definition
+    validation_name = f"{asset_name}_{suite_name}_validation"
+    validation_definition = caches["validation_definitions"].get(validation_name)
+    if validation_definition is None:
+        validation_definition = context.validation_definitions.add(
+            gx.ValidationDefinition(
+                name=validation_name,
+                data=batch_definition,
+                suite=suite
             )
+        )
+
+    return validation_definition
+
+
+def store_validation_result(context, validation_definition, result):
+    """Save a batched result to the validation results store, as ``run()`` does.
+
+    Keeps uncommitted/validations (and the Data Docs built from it) complete
+    for suites that bypass ``ValidationDefinition.run()``. The batch is only
+    built (not read) to fill in the same ``meta`` keys GX writes.
+    """
+    batch = validation_definition.batch_definition.get_batch()
+    run_id = RunIdentifier(run_time=datetime.now(timezone.utc))
+    result.meta = {
+        "great_expectations_version": gx.__version__,
+        "batch_spec": batch.batch_spec,
+        "batch_markers": batch.batch_markers,
+        "active_batch_definition": batch.batch_definition,
+        "validation_time": run_id.run_time,
+        "checkpoint_id": None,
+        "batch_parameters": None,
+        "validation_id": validation_definition.id,
+        "run_id": run_id,
+    }
+    key = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier(
+            name=validation_definition.suite.name
+        ),
+        run_id=run_id,
+        batch_identifier=batch.id,
+    )
+    context.validation_results_store.set(key, result)
+
+
+def run_validation(context, datasource_name, asset_name, suite_name, caches=None):
+    """Run a single validation and return results.
+
+    ``caches`` is the dict returned by ``build_lookup_caches``; names missing
+    from it fall back to a regular context lookup. Safe to call from several
+    threads at once.
+    """
+    if caches is None:
+        caches = {"data_sources": {}, "suites": {}, "validation_definitions": {}}
 
-        # Run validation
-        result = validation_definition.run()
+    try:
+        with _context_lock:
+            validation_definition = get_validation_definition(
+                context, datasource_name, asset_name, suite_name, caches
+            )
+            batch_definition = validation_definition.batch_definition
+            asset = batch_definition.data_asset
+            engine = asset.datasource.get_engine()
+
+        # Run validation (the queries run concurrently with other threads).
+        # Suites made only of profiler-generated expectation types are
+        # checked with one aggregate query over the whole table; anything
+        # else, or a partitioned batch definition, goes through GX.
+        result = None
+        if batch_definition.partitioner is None:
+            result = validate_suite_in_sql(
+                validation_definition.suite, engine, asset.table_name, asset.schema_name
+            )
+        if result is None:
+            result = validation_definition.run()
+        else:
+            with _context_lock:
+                store_validation_result(context, validation_definition, result)
 
         success = result.success
         stats = result.results
@@ -49,24 +143,31 @@ def run_validation(context, datasource_name, asset_name, suite_name):
         failed = total - passed
 
         status = "PASSED" if success else "FAILED"
-        print(f"  Status: {status}")
-        print(f"  Expectations: {total} total, {passed} passed, {failed} failed")
+        with _context_lock:
+            print(f"\nValidating {asset_name} against {suite_name}...")
+            print(f"  Status: {status}")
+            print(f"  Expectations: {total} total, {passed} passed, {failed} failed")
 
         return success, result
 
     except Exception as e:
-        print(f"  Error: {e}")
+        with _context_lock:
+            print(f"\nValidating {asset_name} against {suite_name}...")
+            print(f"  Error: {e}")
         return None, None
 
 
-def main():
+def run_validations(context):
+    """Run all auto-generated suites and print a summary.
+
+    Returns a list of ``(asset_name, suite_name, success)`` tuples, where
+    ``success`` is None for validations that could not be run.
+    """
     print("=" * 60)
     print(f"Great Expectations Validation Run")
     print(f"Timestamp: {datetime.now().isoformat()}")
     print("=" * 60)
 
-    context = gx.get_context(project_root_dir="/app")
-
     # Define validations to run (using auto-generated suites)
     validations = [
         ("tpcc_postgres", "warehouse_asset", "warehouse_auto"),
@@ -77,14 +178,23 @@ def main():
     ]
 
     results = []
+    caches = build_lookup_caches(context)
 
-    for datasource_name, asset_name, suite_name in validations:
-        try:
-            success, result = run_validation(context, datasource_name, asset_name, suite_name)
-            results.append((asset_name, suite_name, success))
-        except Exception as e:
-            print(f"  Skipping {suite_name}: {e}")
-            results.append((asset_name, suite_name, None))
+    # Run all validations concurrently; results are reported in list order
+    with ThreadPoolExecutor(max_workers=len(validations)) as executor:
+        futures = [
+            executor.submit(
+                run_validation, context, datasource_name, asset_name, suite_name, caches
+            )
+            for datasource_name, asset_name, suite_name in validations
+        ]
+        for (_, asset_name, suite_name), future in zip(validations, futures):
+            try:
+                success, result = future.result()
+                results.append((asset_name, suite_name, success))
+            except Exception as e:
+                print(f"  Skipping {suite_name}: {e}")
+                results.append((asset_name, suite_name, None))
 
     # Summary
     print("\n" + "=" * 60)
@@ -102,8 +212,16 @@ def main():
     print(f"\nTotal: {passed} passed, {failed} failed, {skipped} skipped")
     print("=" * 60)
 
+    return results
+
+
+def main():
+    context = gx.get_context(project_root_dir="/app")
+
+    results = run_validations(context)
+
     # Exit with error code if any failures
-    if failed > 0:
+    if any(success is False for _, _, success in results):
         exit(1)
 
 
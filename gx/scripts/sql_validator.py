@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Evaluate an expectation suite with a single aggregate query.
+
+GX's SQL execution engine issues separate metric queries per expectation,
+so a wide suite scans the table many times. For the expectation types the
+auto-profiler generates, every check can be expressed as an aggregate, so
+the whole suite is evaluated here in one scan and mapped back to GX
+result objects (a uniqueness check that finds duplicates adds one query to
+count them). Suites containing any other expectation type, non-literal
+parameters or a row condition are left to GX.
+"""
+
+from great_expectations.core import (
+    ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
+)
+from sqlalchemy import text
+
+
+class _QueryBuilder:
+    """Collects SELECT fragments, reusing identical ones across expectations."""
+
+    def __init__(self):
+        self.fragments = []
+        self.params = {}
+        self._index = {}
+
+    def add(self, fragment):
+        if fragment not in self._index:
+            self._index[fragment] = len(self.fragments)
+            self.fragments.append(fragment)
+        return self._index[fragment]
+
+    def bind(self, value):
+        name = f"p{len(self.params)}"
+        self.params[name] = value
+        return f":{name}"
+
+
+# Expectation types _plan_expectation can evaluate; anything else goes to GX
+_SUPPORTED_TYPES = (
+    "expect_table_row_count_to_be_between",
+    "expect_column_values_to_not_be_null",
+    "expect_column_values_to_be_between",
+    "expect_column_value_lengths_to_be_between",
+    "expect_column_values_to_be_unique",
+)
+
+
+def _is_literal(value):
+    return value is None or isinstance(value, (int, float))
+
+
+def _out_of_range_fragment(expr, exp, query):
+    """Count rows where ``expr`` falls outside the expectation's bounds."""
+    min_value, max_value = exp.min_value, exp.max_value
+    if not (_is_literal(min_value) and _is_literal(max_value)):
+        return None
+
+    conditions = []
+    if min_value is not None:
+        op = "<=" if getattr(exp, "strict_min", False) else "<"
+        conditions.append(f"{expr} {op} {query.bind(min_value)}")
+    if max_value is not None:
+        op = ">=" if getattr(exp, "strict_max", False) else ">"
+        conditions.append(f"{expr} {op} {query.bind(max_value)}")
+    if not conditions:
+        return None
+
+    return f"SUM(CASE WHEN {' OR '.join(conditions)} THEN 1 ELSE 0 END)"
+
+
+def _plan_expectation(exp, query, quote, table):
+    """Add the fragments an expectation needs; return an evaluator or None.
+
+    Evaluators take the aggregate row and the open connection, for checks
+    that need a follow-up query. Conditional expectations (``row_condition``)
+    are left to GX, since the aggregate scans every row of the table.
+    """
+    if getattr(exp, "row_condition", None) or getattr(exp, "condition_parser", None):
+        return None
+
+    exp_type = exp.expectation_type
+    if exp_type not in _SUPPORTED_TYPES:
+        return None
+
+    # Suite parameters ({"$PARAMETER": ...}) are resolved by GX, not here
+    mostly = getattr(exp, "mostly", None)
+    strict_min = getattr(exp, "strict_min", False)
+    strict_max = getattr(exp, "strict_max", False)
+    if not all(_is_literal(v) for v in (mostly, strict_min, strict_max)):
+        return None
+    if mostly is None:
+        mostly = 1
+    total_idx = query.add("COUNT(*)")
+
+    if exp_type == "expect_table_row_count_to_be_between":
+        min_value, max_value = exp.min_value, exp.max_value
+        if not (_is_literal(min_value) and _is_literal(max_value)):
+            return None
+
+        def evaluate(row, conn):
+            observed = row[total_idx]
+            above_min = min_value is None or (
+                observed > min_value if strict_min else observed >= min_value
+            )
+            below_max = max_value is None or (
+                observed < max_value if strict_max else observed <= max_value
+            )
+            return above_min and below_max, {"observed_value": observed}
+
+        return evaluate
+
+    col = quote(exp.column)
+    if exp_type == "expect_column_values_to_not_be_null":
+        null_idx = query.add(f"SUM(CASE WHEN {col} IS NULL THEN 1 ELSE 0 END)")
+
+        def evaluate(row, conn):
+            total, unexpected = row[total_idx], row[null_idx] or 0
+            return _column_result(total, total, unexpected, mostly)
+
+        return evaluate
+
+    range_exprs = {
+        "expect_column_values_to_be_between": col,
+        "expect_column_value_lengths_to_be_between": f"LENGTH({col})",
+    }
+    if exp_type in range_exprs:
+        out_fragment = _out_of_range_fragment(range_exprs[exp_type], exp, query)
+        if out_fragment is None:
+            return None
+        out_idx = query.add(out_fragment)
+        nonnull_idx = query.add(f"COUNT({col})")
+
+        def evaluate(row, conn):
+            unexpected = row[out_idx] or 0
+            return _column_result(row[total_idx], row[nonnull_idx], unexpected, mostly)
+
+        return evaluate
+
+    if exp_type == "expect_column_values_to_be_unique":
+        nonnull_idx = query.add(f"COUNT({col})")
+        distinct_idx = query.add(f"COUNT(DISTINCT {col})")
+
+        def evaluate(row, conn):
+            unexpected = 0
+            if row[nonnull_idx] != row[distinct_idx]:
+                # GX counts every row that shares its value with another
+                # row, which the aggregate alone cannot tell apart
+                unexpected = conn.execute(text(
+                    f"SELECT COALESCE(SUM(n), 0) FROM ("
+                    f"SELECT COUNT(*) AS n FROM {table} WHERE {col} IS NOT NULL "
+                    f"GROUP BY {col} HAVING COUNT(*) > 1) AS dup"
+                )).scalar()
+            return _column_result(row[total_idx], row[nonnull_idx], unexpected, mostly)
+
+        return evaluate
+
+    return None
+
+
+def _column_result(element_count, checked_count, unexpected, mostly):
+    """Build a GX-style ``result`` dict for a column map expectation."""
+    unexpected_percent = 100.0 * unexpected / checked_count if checked_count else 0.0
+    # Same test as GX: compare the success ratio, not rounded percentages
+    success = (checked_count - unexpected) / checked_count >= mostly if checked_count else True
+    return success, {
+        "element_count": element_count,
+        "unexpected_count": unexpected,
+        "unexpected_percent": unexpected_percent,
+    }
+
+
+def validate_suite_in_sql(suite, engine, table_name, schema_name=None):
+    """Validate ``suite`` against ``table_name`` with one aggregate query.
+
+    Returns an ``ExpectationSuiteValidationResult``, or None when the suite
+    contains an expectation that cannot be evaluated this way.
+    """
+    preparer = engine.dialect.identifier_preparer
+    table = preparer.quote(table_name)
+    if schema_name:
+        table = f"{preparer.quote_schema(schema_name)}.{table}"
+
+    query = _QueryBuilder()
+    plans = []
+    for exp in suite.expectations:
+        evaluate = _plan_expectation(exp, query, preparer.quote, table)
+        if evaluate is None:
+            return None
+        plans.append((exp, evaluate))
+
+    if not plans:
+        return None
+
+    sql = f"SELECT {', '.join(query.fragments)} FROM {table}"
+    results = []
+    with engine.connect() as conn:
+        row = conn.execute(text(sql), query.params).fetchone()
+        for exp, evaluate in plans:
+            success, result = evaluate(row, conn)
+            results.append(ExpectationValidationResult(
+                success=success,
+                expectation_config=exp.configuration,
+                result=result
+            ))
+
+    passed = sum(1 for r in results if r.success)
+    return ExpectationSuiteValidationResult(
+        success=passed == len(results),
+        results=results,
+        suite_name=suite.name,
+        statistics={
+            "evaluated_expectations": len(results),
+            "successful_expectations": passed,
+            "unsuccessful_expectations": len(results) - passed,
+            "success_percent": 100.0 * passed / len(results),
+        }
+    )